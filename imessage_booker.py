@@ -5,36 +5,137 @@ and returns them for use by the booking flow.
 """
 
 import asyncio
+import itertools
 import os
 import re
+import select
 import shutil
 import sqlite3
 import subprocess
+import threading
 import time
 import logging
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
 
+_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})(?:/(\d{2,4}))?')
+_TIME12_RE = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)\b')
+_TIME24_RE = re.compile(r'\b(\d{1,2}):(\d{2})\b')
+_PLAYERS_RE = re.compile(r'(\d)\s*player')
+_DIGIT_RE = re.compile(r'\b([1-4])\b')
+_ENV_RE = re.compile(r'^\s*([A-Za-z_]\w*)\s*=\s*(.*?)\s*$')
+# Whole-message fast path for the common "tomorrow 7am 1 player" shape
+_FAST_RE = re.compile(r'^(tomorrow|today)\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)\s+(\d)\s*players?$')
+_SEARCH_RE = re.compile(r"available|what'?s|search|show|list|check")
+# Full names may run on ("saturdays", "saturday's"); a bare abbreviation must end the word
+_DOW_RE = re.compile(r'\b(mon|tue|wed|thu|fri|sat|sun)(?:day|sday|nesday|rsday|urday|\b)')
+_DOW_INDEX = {'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6}
+
+
+class _NonDigitTable(dict):
+    """
+    str.translate table that deletes everything \\D would match.
+    Latin-1 is prefilled; any other code point is classified on first sight.
+    """
+
+    def __missing__(self, codepoint):
+        self[codepoint] = codepoint if chr(codepoint).isdecimal() else None
+        return self[codepoint]
+
+
+_NONDIGITS = _NonDigitTable({c: (c if chr(c).isdecimal() else None) for c in range(256)})
+
+# Apple's Core Data epoch (2001-01-01 00:00:00 UTC) as Unix nanoseconds
+_APPLE_EPOCH_NS = 978307200_000_000_000
+
 
 def _load_dotenv():
     """Load .env file from the script directory if it exists"""
     env_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
     try:
         with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ.setdefault(key.strip(), value.strip())
+            data = f.read()
     except FileNotFoundError:
-        pass
+        return
+    for line in data.splitlines():
+        m = _ENV_RE.match(line)
+        if m:
+            os.environ.setdefault(m[1], m[2])
 
 
-def send_imessage(phone: str, message: str):
-    """Send an iMessage via AppleScript."""
-    escaped = message.replace('\\', '\\\\').replace('"', '\\"')
+def _escape_applescript(text: str) -> str:
+    """Escape text for a single-line AppleScript string literal."""
+    return (text.replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+_PROMPT_MESSAGE = (
+    "Golf booker ready! Reply with:\n"
+    "  Book: 'tomorrow 7am 1 player'\n"
+    "  Search: 'what's available today'"
+)
+
+# Long-lived `osascript -i` coprocess: one AppleScript engine warm-up per
+# run instead of a fork/exec + warm-up per message.
+_OSA: Optional[subprocess.Popen] = None
+_OSA_LOCK = threading.Lock()
+_OSA_SEQ = itertools.count(1)
+
+
+def _osa_process() -> subprocess.Popen:
+    global _OSA
+    if _OSA is None or _OSA.poll() is not None:
+        _OSA = subprocess.Popen(
+            ['osascript', '-i'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        )
+    return _OSA
+
+
+def _osa_kill():
+    global _OSA
+    if _OSA is not None:
+        _OSA.kill()
+        _OSA = None
+
+
+def _osa_write(line: str) -> Tuple[subprocess.Popen, str]:
+    """
+    Hand one AppleScript line to the coprocess, followed by a sentinel to read
+    up to. Raises OSError if spawning or writing fails, i.e. before the line
+    could have run.
+    """
+    proc = _osa_process()
+    sentinel = f'OK:{next(_OSA_SEQ)}'
+    proc.stdin.write(f'{line}\n"{sentinel}"\n'.encode())
+    proc.stdin.flush()
+    return proc, sentinel
+
+
+def _osa_read(proc: subprocess.Popen, sentinel: str, timeout: float = 15) -> str:
+    """Return everything the coprocess printed before `sentinel`."""
+    fd = proc.stdout.fileno()
+    buf = b''
+    deadline = time.monotonic() + timeout
+    while sentinel.encode() not in buf:
+        remaining = deadline - time.monotonic()
+        ready, _, _ = select.select([fd], [], [], max(0, remaining))
+        if not ready:
+            raise TimeoutError("osascript coprocess did not respond")
+        chunk = os.read(fd, 4096)
+        if not chunk:
+            raise EOFError("osascript coprocess exited")
+        buf += chunk
+    # Drop the sentinel's own line (e.g. '=> "OK:3"')
+    head = buf.decode(errors='replace').split(sentinel)[0]
+    return head[:head.rfind('\n') + 1]
+
+
+def _send_imessage_oneshot(phone: str, escaped: str):
+    """Send via a fresh osascript process (fallback if the coprocess breaks)."""
     script = f'''
     tell application "Messages"
         set targetService to 1st account whose service type = iMessage
@@ -48,71 +149,190 @@ def send_imessage(phone: str, message: str):
     )
     if result.returncode != 0:
         raise RuntimeError(f"Failed to send iMessage: {result.stderr.strip()}")
+
+
+def send_imessage(phone: str, message: str):
+    """Send an iMessage via AppleScript."""
+    escaped = _escape_applescript(message)
+    line = (
+        f'tell application "Messages" to send "{escaped}" to participant "{phone}" '
+        f'of (1st account whose service type = iMessage)'
+    )
+    with _OSA_LOCK:
+        try:
+            proc, sentinel = _osa_write(line)
+        except OSError as e:
+            # Nothing reached Messages yet, so a one-shot resend can't duplicate it
+            logger.debug("osascript coprocess failed (%s), respawning", e)
+            _osa_kill()
+            _send_imessage_oneshot(phone, escaped)
+        else:
+            try:
+                output = _osa_read(proc, sentinel)
+            except (OSError, TimeoutError, EOFError) as e:
+                # The send line already went out and may still be delivered
+                # (e.g. a slow Messages.app launch): don't resend, just fail
+                _osa_kill()
+                raise RuntimeError(f"Failed to send iMessage: no reply from osascript ({e})") from e
+            if 'error' in output.lower():
+                raise RuntimeError(f"Failed to send iMessage: {output.strip()}")
     logger.info(f"Sent iMessage to {phone}")
 
 
-def get_latest_reply(phone: str, since_timestamp: float) -> Optional[str]:
+def _fast_copy(src: str, dst: str):
     """
-    Read the latest inbound iMessage from `phone` received after `since_timestamp`.
-    Copies chat.db to /tmp to avoid locking issues.
-    Returns the message text, or None if no new message found.
+    Copy `src` to `dst` without bouncing the bytes through userspace.
+    Uses copy_file_range on Linux; elsewhere shutil.copyfile already takes
+    the kernel fast path (fcopyfile on macOS).
     """
-    chat_db = os.path.expanduser('~/Library/Messages/chat.db')
+    if not hasattr(os, 'copy_file_range'):
+        shutil.copyfile(src, dst)
+        return
+
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            remaining = os.fstat(src_fd).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        finally:
+            os.close(dst_fd)
+    except OSError:
+        # Cross-filesystem or unsupported fs — fall back to a regular copy
+        shutil.copyfile(src, dst)
+    finally:
+        os.close(src_fd)
+
+
+# Skip is_from_me filter — it can be inverted when both devices
+# share the same Apple ID.  Instead, exclude messages that look
+# like the prompt we sent (start with "Golf booker").
+_LATEST_REPLY_SQL = '''
+    SELECT m.text, m.date
+    FROM message m
+    JOIN chat_message_join cmj ON m.ROWID = cmj.message_id
+    JOIN chat c ON cmj.chat_id = c.ROWID
+    WHERE m.date > ?
+      AND m.date < ?
+      AND c.chat_identifier IN (?, ?, ?)
+      AND m.text IS NOT NULL
+      AND m.text NOT LIKE 'Golf booker%'
+    ORDER BY m.date DESC
+    LIMIT 1
+'''
+
+
+# Long-lived read-only connection to chat.db, reused across polls so the
+# SELECT stays prepared in the statement cache.
+_CONN: Optional[sqlite3.Connection] = None
+
+
+def _read_latest_direct(chat_db: str, params: tuple) -> Optional[tuple]:
+    """Query chat.db in place over a read-only connection (no copy)."""
+    global _CONN
+    if _CONN is None:
+        # mode=ro still honours the WAL, so messages Messages.app hasn't
+        # checkpointed yet are visible; immutable=1 would hide them.
+        uri = f'file:{quote(chat_db)}?mode=ro'
+        _CONN = sqlite3.connect(uri, uri=True, isolation_level=None,
+                                cached_statements=32, check_same_thread=False)
+        if logger.isEnabledFor(logging.DEBUG):
+            plan = _CONN.execute('EXPLAIN QUERY PLAN ' + _LATEST_REPLY_SQL, params).fetchall()
+            for step in plan:
+                logger.debug("chat.db query plan: %s", step[-1])
+    try:
+        return _CONN.execute(_LATEST_REPLY_SQL, params).fetchone()
+    except sqlite3.OperationalError:
+        # Drop the handle so the next poll reconnects from scratch
+        _CONN.close()
+        _CONN = None
+        raise
+
+
+async def _read_latest_from_copy(chat_db: str, params: tuple) -> Optional[tuple]:
+    """Copy chat.db to /tmp and query the copy, for when chat.db is locked."""
     tmp_db = '/tmp/chat_db_copy.sqlite'
 
     # Copy the WAL and SHM files too — recent messages live in the WAL
-    # and won't be visible without them.
-    shutil.copy2(chat_db, tmp_db)
-    for suffix in ('-wal', '-shm'):
-        src = chat_db + suffix
-        if os.path.exists(src):
-            shutil.copy2(src, tmp_db + suffix)
-
-    # Apple's Core Data epoch is 2001-01-01 00:00:00 UTC
-    # Convert Unix timestamp to Apple epoch (nanoseconds)
-    apple_epoch_offset = 978307200
-    apple_timestamp = (since_timestamp - apple_epoch_offset) * 1_000_000_000
-
-    # Normalize phone: strip everything but digits, match last 10
-    digits = re.sub(r'\D', '', phone)
-    if len(digits) >= 10:
-        digits = digits[-10:]
-    phone_pattern = f'%{digits}'
-
-    conn = sqlite3.connect(tmp_db)
+    # and won't be visible without them.  Run the copies concurrently so
+    # the small WAL/SHM copies overlap the long main-db read.
+    await asyncio.gather(*(
+        asyncio.to_thread(_fast_copy, chat_db + suffix, tmp_db + suffix)
+        for suffix in ('', '-wal', '-shm')
+        if suffix == '' or os.path.exists(chat_db + suffix)
+    ))
+
+    # Autocommit + relaxed durability: this is a throwaway copy we only
+    # read from, so skip journal fsyncs and serve pages via mmap.
+    conn = sqlite3.connect(tmp_db, isolation_level=None)
     try:
-        # Skip is_from_me filter — it can be inverted when both devices
-        # share the same Apple ID.  Instead, exclude messages that look
-        # like the prompt we sent (start with "Golf booker").
-        cursor = conn.execute('''
-            SELECT m.text, m.date
-            FROM message m
-            JOIN chat_message_join cmj ON m.ROWID = cmj.message_id
-            JOIN chat c ON cmj.chat_id = c.ROWID
-            WHERE m.date > ?
-              AND c.chat_identifier LIKE ?
-              AND m.text IS NOT NULL
-              AND m.text NOT LIKE 'Golf booker%'
-            ORDER BY m.date DESC
-            LIMIT 1
-        ''', (int(apple_timestamp), phone_pattern))
-        row = cursor.fetchone()
-        if row:
-            logger.info(f"Found message: {row[0]!r} (date={row[1]})")
-        else:
-            logger.debug(f"No new messages after apple_ts={int(apple_timestamp)} for {phone_pattern}")
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=268435456')
+        conn.execute('PRAGMA cache_size=-20000')
+        return conn.execute(_LATEST_REPLY_SQL, params).fetchone()
     finally:
         conn.close()
         for suffix in ('', '-wal', '-shm'):
-            path = tmp_db + suffix
-            if os.path.exists(path):
-                os.remove(path)
+            try:
+                os.unlink(tmp_db + suffix)
+            except FileNotFoundError:
+                pass
+
+
+async def get_latest_reply(phone: str, since_ns: int) -> Optional[str]:
+    """
+    Read the latest inbound iMessage from `phone` received after `since_ns`
+    (Unix time in nanoseconds, as returned by time.time_ns()).
+    Opens chat.db read-only in place; falls back to querying a /tmp copy
+    if the live database is locked.
+    Returns the message text, or None if no new message found.
+    """
+    chat_db = os.path.expanduser('~/Library/Messages/chat.db')
+
+    # Convert Unix nanoseconds to Apple epoch nanoseconds (pure int math)
+    apple_timestamp = since_ns - _APPLE_EPOCH_NS
+    # Upper bound is a no-op semantically but lets SQLite range-scan the date index
+    apple_upper = time.time_ns() + 60_000_000_000 - _APPLE_EPOCH_NS
+
+    # Normalize phone: strip everything but digits, match last 10.
+    # Messages stores the handle as +1XXXXXXXXXX (sometimes without the +
+    # or country code); an exact IN match can use the chat_identifier
+    # index where LIKE '%digits' cannot.
+    digits = phone.translate(_NONDIGITS)
+    if len(digits) >= 10:
+        digits = digits[-10:]
+    candidates = (digits, '+1' + digits, '1' + digits)
+
+    params = (apple_timestamp, apple_upper, *candidates)
+    try:
+        row = _read_latest_direct(chat_db, params)
+    except sqlite3.OperationalError as e:
+        logger.debug("Direct read of chat.db failed (%s), falling back to copy", e)
+        row = await _read_latest_from_copy(chat_db, params)
+
+    if row:
+        logger.info(f"Found message: {row[0]!r} (date={row[1]})")
+    else:
+        logger.debug("No new messages after apple_ts=%d for %s", apple_timestamp, digits)
 
     if row and row[0]:
         return row[0].strip()
     return None
 
 
+def _fmt_date(d: datetime) -> str:
+    """MM/DD/YYYY without going through strftime's locale-aware C path."""
+    return f'{d.month:02d}/{d.day:02d}/{d.year}'
+
+
 def parse_booking_request(text: str) -> dict:
     """
     Parse a natural-language booking request into structured data.
@@ -123,38 +343,51 @@ def parse_booking_request(text: str) -> dict:
       "saturday 7am"
       "2/14 3:30pm 4"
 
-    Returns: {date: "MM/DD/YYYY", time: "HH:MM", players: int, search_only: bool}
+    Returns: {date: "MM/DD/YYYY", time: "HH:MM", hour: int, minute: int,
+              players: int, search_only: bool}
 
     If the message contains "available", "what's", or "search", search_only=True.
     """
     text = text.strip().lower()
     today = datetime.now()
-    search_keywords = ['available', "what's", 'whats', 'search', 'show', 'list', 'check']
-    is_search = any(kw in text for kw in search_keywords)
-    result = {'date': None, 'time': None, 'players': 1, 'search_only': is_search}
+    is_search = _SEARCH_RE.search(text) is not None
+    result = {'date': None, 'time': None, 'hour': None, 'minute': None,
+              'players': 1, 'search_only': is_search}
+
+    fast = _FAST_RE.match(text)
+    if fast:
+        day, hour, minute, period, players = fast.groups()
+        hour, minute = int(hour), int(minute or 0)
+        if period == 'pm' and hour != 12:
+            hour += 12
+        elif period == 'am' and hour == 12:
+            hour = 0
+        result['date'] = _fmt_date(today + timedelta(days=1) if day == 'tomorrow' else today)
+        result['time'] = f'{hour:02d}:{minute:02d}'
+        result['hour'], result['minute'] = hour, minute
+        result['players'] = int(players)
+        return result
 
     # --- Parse date ---
     # "tomorrow"
     if 'tomorrow' in text:
-        result['date'] = (today + timedelta(days=1)).strftime('%m/%d/%Y')
+        result['date'] = _fmt_date(today + timedelta(days=1))
     # "today"
     elif 'today' in text:
-        result['date'] = today.strftime('%m/%d/%Y')
+        result['date'] = _fmt_date(today)
     else:
-        # Day of week: "monday", "tuesday", etc.
-        days_of_week = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-        for i, day_name in enumerate(days_of_week):
-            if day_name in text or day_name[:3] in text.split():
-                current_dow = today.weekday()  # 0=Monday
-                days_ahead = (i - current_dow) % 7
-                if days_ahead == 0:
-                    days_ahead = 7  # Next week if today
-                result['date'] = (today + timedelta(days=days_ahead)).strftime('%m/%d/%Y')
-                break
+        # Day of week: "monday", "tuesday", etc. (or "mon", "tue", ...)
+        dow_match = _DOW_RE.search(text)
+        if dow_match:
+            current_dow = today.weekday()  # 0=Monday
+            days_ahead = (_DOW_INDEX[dow_match.group(1)] - current_dow) % 7
+            if days_ahead == 0:
+                days_ahead = 7  # Next week if today
+            result['date'] = _fmt_date(today + timedelta(days=days_ahead))
 
         # MM/DD or M/D format (with optional /YYYY)
         if not result['date']:
-            date_match = re.search(r'(\d{1,2})/(\d{1,2})(?:/(\d{2,4}))?', text)
+            date_match = _DATE_RE.search(text)
             if date_match:
                 month = int(date_match.group(1))
                 day = int(date_match.group(2))
@@ -169,11 +402,11 @@ def parse_booking_request(text: str) -> dict:
 
     # Default to tomorrow if no date parsed
     if not result['date']:
-        result['date'] = (today + timedelta(days=1)).strftime('%m/%d/%Y')
+        result['date'] = _fmt_date(today + timedelta(days=1))
 
     # --- Parse time ---
     # Matches: "2pm", "2:30pm", "14:00", "2:30 pm", "10 am"
-    time_match = re.search(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)\b', text)
+    time_match = _TIME12_RE.search(text)
     if time_match:
         hour = int(time_match.group(1))
         minute = int(time_match.group(2) or 0)
@@ -183,27 +416,30 @@ def parse_booking_request(text: str) -> dict:
         elif period == 'am' and hour == 12:
             hour = 0
         result['time'] = f'{hour:02d}:{minute:02d}'
+        result['hour'], result['minute'] = hour, minute
     else:
         # Try 24h format: "14:00"
-        time_24_match = re.search(r'\b(\d{1,2}):(\d{2})\b', text)
+        time_24_match = _TIME24_RE.search(text)
         if time_24_match:
             hour = int(time_24_match.group(1))
             minute = int(time_24_match.group(2))
             if 0 <= hour <= 23:
                 result['time'] = f'{hour:02d}:{minute:02d}'
+                result['hour'], result['minute'] = hour, minute
 
     # If no time was given, treat as a search request
     if not result['time']:
         result['time'] = '08:00'
+        result['hour'], result['minute'] = 8, 0
         result['search_only'] = True
 
     # --- Parse players ---
-    players_match = re.search(r'(\d)\s*player', text)
+    players_match = _PLAYERS_RE.search(text)
     if players_match:
         result['players'] = int(players_match.group(1))
     else:
         # Standalone digit at end or near "player"
-        digit_match = re.search(r'\b([1-4])\b', text)
+        digit_match = _DIGIT_RE.search(text)
         # Only use standalone digit if it's not part of the time or date
         if digit_match:
             # Check it's not the time hour or date component
@@ -221,7 +457,8 @@ async def prompt_for_booking(phone: str = None, poll_interval: int = 30, timeout
 
     Args:
         phone: Phone number to message. Defaults to BOOKING_PHONE env var.
-        poll_interval: Seconds between checking for replies (default 30).
+        poll_interval: Max seconds between checking for replies (default 30).
+            Polling starts at 2s and backs off toward this cap.
         timeout: Max seconds to wait for a reply (default 600 = 10 min).
 
     Returns:
@@ -232,34 +469,44 @@ async def prompt_for_booking(phone: str = None, poll_interval: int = 30, timeout
     if not phone:
         raise ValueError("No phone number provided. Set BOOKING_PHONE in .env")
 
-    prompt_message = (
-        "Golf booker ready! Reply with:\n"
-        "  Book: 'tomorrow 7am 1 player'\n"
-        "  Search: 'what's available today'"
-    )
-
-    send_imessage(phone, prompt_message)
-    sent_at = time.time()
-    deadline = sent_at + timeout
+    send_imessage(phone, _PROMPT_MESSAGE)
+    # Wall clock only for the chat.db comparison; the deadline is monotonic
+    # so an NTP step or DST change can't stretch or cut short the wait
+    sent_at_ns = time.time_ns()
+    deadline_ns = time.monotonic_ns() + timeout * 1_000_000_000
 
     logger.info(f"Waiting up to {timeout}s for reply from {phone}...")
 
-    while time.time() < deadline:
-        await asyncio.sleep(poll_interval)
-        reply = get_latest_reply(phone, sent_at)
+    # Replies rarely land in the first second, but often within a few:
+    # start with a short interval and back off toward poll_interval.
+    base_interval = min(2, poll_interval)
+    current_interval = base_interval
+
+    while True:
+        # One monotonic read per iteration drives both the exit check and the sleep
+        remaining = (deadline_ns - time.monotonic_ns()) / 1e9
+        if remaining <= 0:
+            break
+        await asyncio.sleep(min(current_interval, remaining))
+        try:
+            reply = await get_latest_reply(phone, sent_at_ns)
+        except sqlite3.OperationalError as e:
+            # Only a locked/busy database is worth polling again; anything
+            # else (no Full Disk Access, missing chat.db) won't fix itself
+            msg = str(e).lower()
+            if 'locked' not in msg and 'busy' not in msg:
+                raise
+            logger.warning(f"chat.db busy, retrying: {e}")
+            current_interval = base_interval
+            continue
         if reply:
             logger.info(f"Received reply: {reply}")
             booking = parse_booking_request(reply)
             logger.info(f"Parsed booking: {booking}")
 
             # Send confirmation
-            hour = int(booking['time'].split(':')[0])
-            minute = booking['time'].split(':')[1]
-            period = 'AM' if hour < 12 else 'PM'
-            display_hour = hour if hour <= 12 else hour - 12
-            if display_hour == 0:
-                display_hour = 12
-            time_display = f"{display_hour}:{minute} {period}"
+            hour, minute = booking['hour'], booking['minute']
+            time_display = f"{hour % 12 or 12}:{minute:02d} {'AM' if hour < 12 else 'PM'}"
 
             if booking.get('search_only'):
                 confirm_msg = f"Searching available tee times for {booking['date']}..."
@@ -270,6 +517,7 @@ async def prompt_for_booking(phone: str = None, poll_interval: int = 30, timeout
                 )
             send_imessage(phone, confirm_msg)
             return booking
+        current_interval = min(poll_interval, current_interval * 1.5)
 
     logger.warning("Timed out waiting for iMessage reply")
     send_imessage(phone, "Golf booker timed out waiting for your reply. Run again when ready.")
@@ -4,7 +4,7 @@ Auto-submits the booking. Run with: nohup python3 midnight_book.py &
 """
 import asyncio
 from datetime import datetime, timedelta
-from tee_time_booker import TeeTimeBooker
+from tee_time_booker import PREWARM_SECONDS, TeeTimeBooker
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -15,8 +15,30 @@ TARGET_TIME = '08:00'
 NUM_PLAYERS = 1
 
 
+async def _sleep_until(target_run, wait):
+    """
+    Wait `wait` seconds on the loop's monotonic clock via a call_later-set
+    Event, waking hourly to log progress so a stuck process is observable.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    while True:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return
+        woke = asyncio.Event()
+        handle = loop.call_later(min(remaining, 3600), woke.set)
+        try:
+            await woke.wait()
+        finally:
+            handle.cancel()
+        remaining = deadline - loop.time()
+        if remaining > 0:
+            logger.info(f"Still sleeping until {target_run} ({remaining/3600:.1f}h left)")
+
+
 async def main():
-    booker = TeeTimeBooker()
+    booker = await TeeTimeBooker.create()
 
     # Override config for this run
     booker.config['automation']['auto_submit'] = True
@@ -30,7 +52,10 @@ async def main():
 
     if wait > 0:
         logger.info(f"Sleeping until {target_run} ({wait:.0f}s / {wait/3600:.1f}h)")
-        await asyncio.sleep(wait)
+        # Launch, load the search page and log in just before, so booking starts at once
+        await _sleep_until(target_run, wait - PREWARM_SECONDS)
+        await booker.prewarm()
+        await _sleep_until(target_run, (target_run - datetime.now()).total_seconds())
 
     logger.info(f"7am! Booking {TARGET_DATE} at {TARGET_TIME} for {NUM_PLAYERS} player(s)")
 
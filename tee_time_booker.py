@@ -4,10 +4,12 @@ Automatically books tee times at specified dates/times using browser automation
 """
 
 import asyncio
+import copy
 import json
 import os
+import re
 from datetime import datetime, timedelta
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 import logging
 
 # Configure logging
@@ -17,21 +19,237 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# __file__ is already absolute on Python 3.9+, so no abspath() stat needed
+_ENV_PATH = os.path.join(os.path.dirname(__file__), '.env')
+_dotenv_loaded = False
+# Cookies/localStorage saved at teardown so the next run starts with the site's session
+_STORAGE_STATE_PATH = os.path.join(os.path.dirname(__file__), '.pw_storage_state.json')
+
+# config path -> (st_mtime_ns, parsed JSON); instances get a deep copy since callers mutate it
+_CONFIG_CACHE = {}
+
+# Resources the booker never reads; aborting them speeds up every page load
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+BLOCKED_URL_PARTS = ('google-analytics', 'googletagmanager', 'doubleclick', 'facebook.net', 'hotjar')
+
+# Routing a context turns off Chromium's HTTP cache, so static bundles are cached
+# here instead: url -> (status, headers, body), kept for the life of the process
+CACHED_RESOURCE_TYPES = frozenset({'script', 'stylesheet'})
+# Describe the encoded transfer (the cached body is already decoded) or would
+# replay a stale cookie over the live session on every hit
+_UNCACHED_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding', 'set-cookie'})
+# Cache-Control directives that mean the response must not be reused
+_NO_REUSE_DIRECTIVES = ('no-store', 'no-cache', 'private')
+_RESPONSE_CACHE = {}
+
+# How long before a booking window opens to load the search page and log in
+PREWARM_SECONDS = 15
+# The last stretch before a window opens is polled rather than slept through
+WINDOW_EDGE_SECONDS = 5
+
+# Default per-action and per-navigation timeouts for every context (ms)
+ACTION_TIMEOUT_MS = 5000
+NAVIGATION_TIMEOUT_MS = 15000
+
+# Trim Chromium for unattended runs: /dev/shm is tiny in containers, and a
+# headless browser has no use for the GPU process
+CHROMIUM_ARGS = ('--disable-dev-shm-usage',)
+HEADLESS_CHROMIUM_ARGS = CHROMIUM_ARGS + ('--disable-gpu',)
+
+# Turn off CSS animations/transitions so elements are actionable the moment they appear
+DISABLE_ANIMATIONS_SCRIPT = """
+const s = document.createElement('style');
+s.textContent = '*,*::before,*::after{animation:none!important;transition:none!important;caret-color:transparent!important}';
+if (document.documentElement) {
+    document.documentElement.appendChild(s);
+} else {
+    document.addEventListener('DOMContentLoaded', () => document.head.appendChild(s));
+}
+"""
+
+# The date field SET_FILTERS_JS fills, as CSS (same type/name/id test as the JS loop)
+DATE_INPUT_SELECTOR = 'input[type="date"], input[name*="date" i], input[id*="date" i]'
+
+# Step 1 of book_tee_time in a single evaluate: (at DEBUG) list what's on the
+# page, then set the player-count select, the date input and the begintime input
+SET_FILTERS_JS = '''({players, date, time, debug}) => {
+    const setValue = (inp, value) => {
+        window.__setInputValue.call(inp, value);
+        inp.dispatchEvent(new Event('input', {bubbles: true}));
+        inp.dispatchEvent(new Event('change', {bubbles: true}));
+    };
+    const allSelects = Array.from(document.querySelectorAll('select'));
+    const allInputs = Array.from(document.querySelectorAll('input'));
+
+    // Diagnostics are only serialized back when the caller is logging at DEBUG
+    const selects = !debug ? [] : allSelects.map((s, i) => ({
+        index: i,
+        name: s.name,
+        id: s.id,
+        options: Array.from(s.options).map(o => ({value: o.value, text: o.text.trim()}))
+    }));
+    const inputs = !debug ? [] : allInputs.map((inp, i) => ({
+        index: i, type: inp.type, name: inp.name, id: inp.id, value: inp.value
+    }));
+
+    // Trim each option's text once and reuse it for both the test and the match
+    let playerResult = {found: false};
+    for (const s of allSelects) {
+        const opts = Array.from(s.options, o => [o, o.text.trim()]);
+        if (!opts.some(([, t]) => /^[1-4]$/.test(t))) continue;
+        const hit = opts.find(([o, t]) => t === players || o.value === players);
+        if (hit) {
+            s.value = hit[0].value;
+            s.dispatchEvent(new Event('change', {bubbles: true}));
+            playerResult = {found: true, name: s.name, selected: hit[1]};
+            break;
+        }
+    }
+
+    let dateResult = {found: false};
+    for (const inp of allInputs) {
+        if (inp.type === 'date' || inp.name.toLowerCase().includes('date') || inp.id.toLowerCase().includes('date')) {
+            setValue(inp, date);
+            dateResult = {found: true, name: inp.name, id: inp.id};
+            break;
+        }
+    }
+
+    let timeResult = {found: false};
+    const timeInput = document.querySelector('input[name="begintime"], input#begintime');
+    if (timeInput) {
+        setValue(timeInput, time);
+        timeResult = {found: true, name: timeInput.name, value: time};
+    }
+
+    return {selects, inputs, playerResult, dateResult, timeResult};
+}'''
+
+# Native value setter (bypasses framework-patched setters), looked up once per
+# document rather than once per input inside every evaluate
+CACHE_INPUT_SETTER_SCRIPT = """
+window.__setInputValue = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
+"""
+
+# The Available cart button, in order of preference: not marked "error", marked
+# "success", or labelled Available. All three fallbacks run in one round-trip.
+FIND_CART_BUTTON_JS = '''() =>
+    document.querySelector('a.cart-button:not(.error)') ||
+    document.querySelector('a.cart-button.success') ||
+    document.querySelector('a.cart-button[title*="Available"], a.cart-button[aria-label*="Available"]')
+'''
+
+# Selectors used on every attempt, built once
+SIGN_IN_LINK = 'a:has-text("SIGN IN"), a:has-text("Sign In"), a:has-text("Login")'
+USERNAME_INPUT = 'input[name*="user"], input[id*="user"], input[type="text"]'
+PASSWORD_INPUT = 'input[type="password"]'
+LOGIN_BUTTON = 'button:has-text("Login"), input[type="submit"]'
+CONTINUE_WITH_LOGIN = 'button:has-text("Continue with Login"), a:has-text("Continue with Login")'
+CONTINUE_BUTTON = 'button:has-text("Continue"), input[value="Continue"]'
+CART_BUTTON = 'a.cart-button'
+AVAILABLE_ROW_CART_BUTTON = f'tr:has-text("Available") {CART_BUTTON}'
+# What follows a cart click: the login form, or member selection when already signed in
+AFTER_CART_CLICK = f'{PASSWORD_INPUT}, {CONTINUE_BUTTON}'
+SIGN_IN_OR_LOGIN_FORM = f'{SIGN_IN_LINK}, {PASSWORD_INPUT}'
+LOGIN_FIELD_SELECTORS = (USERNAME_INPUT, PASSWORD_INPUT)
+
+# Fill both login fields in one round-trip; false if either field isn't there yet.
+# The selectors are baked in here, so each call only sends the credentials.
+FILL_LOGIN_JS = '''({username, password}) => {
+    const setValue = (selector, value) => {
+        const inp = document.querySelector(selector);
+        if (!inp) return false;
+        window.__setInputValue.call(inp, value);
+        inp.dispatchEvent(new Event('input', {bubbles: true}));
+        inp.dispatchEvent(new Event('change', {bubbles: true}));
+        return true;
+    };
+    return setValue(%s, username) && setValue(%s, password);
+}''' % (json.dumps(USERNAME_INPUT), json.dumps(PASSWORD_INPUT))
+
+# Login has settled once the password field is gone or the Active Session Alert is up
+LOGIN_SETTLED_JS = '''() => !document.querySelector('input[type="password"]') ||
+    Array.from(document.querySelectorAll('button, a')).some(el => el.textContent.includes('Continue with Login'))
+'''
+
+# Accessible names of the final confirm button (buttons and submit inputs alike)
+FINAL_CONFIRM_NAME = re.compile(r'Continue|Book|Submit|Checkout', re.I)
+
+
+def _is_confirmation_url(url):
+    """wait_for_url predicate: the booking confirmation/receipt page"""
+    url = url.lower()
+    return 'confirm' in url or 'receipt' in url or 'thank' in url
+
+
+async def _handle_route(route):
+    """
+    Route handler: abort images/fonts/media and analytics, serve scripts and
+    stylesheets from _RESPONSE_CACHE after the first fetch, pass everything else
+    """
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(part in request.url for part in BLOCKED_URL_PARTS):
+        await route.abort()
+    elif request.resource_type in CACHED_RESOURCE_TYPES and request.method == 'GET':
+        cached = _RESPONSE_CACHE.get(request.url)
+        try:
+            if cached is None:
+                response = await route.fetch()
+                cache_control = response.headers.get('cache-control', '').lower()
+                if response.ok and not any(d in cache_control for d in _NO_REUSE_DIRECTIVES):
+                    headers = {k: v for k, v in response.headers.items() if k.lower() not in _UNCACHED_HEADERS}
+                    _RESPONSE_CACHE[request.url] = (response.status, headers, await response.body())
+                # The first response goes through untouched, cookies included
+                await route.fulfill(response=response)
+            else:
+                status, headers, body = cached
+                await route.fulfill(status=status, headers=headers, body=body)
+        except PlaywrightError as e:
+            # An escaped error would leave the request hanging (and a blocking
+            # <script> with it); hand it back to the browser to load or fail itself
+            logger.debug("Response cache bypassed for %s: %s", request.url, e)
+            try:
+                await route.continue_()
+            except PlaywrightError:
+                pass
+    else:
+        await route.continue_()
+
+
 class TeeTimeBooker:
     def __init__(self, config_file='booking_config.json'):
         """Initialize the tee time booker with configuration"""
         self.config = self.load_config(config_file)
         self.booking_url = "https://sccharlestonweb.myvscloud.com/webtrac/web/search.html?module=GR&Search=no&interfaceparameter=webtrac_golf"
+        # Browser state shared across attempts (see _setup/_teardown)
+        self._pw = self._browser = self._context = self._page = None
+        self._page_crashed = False
+        # True while the shared page still shows the search form from an attempt
+        # that found nothing, so the next attempt can re-search without navigating
+        self._search_page_loaded = False
+        # target_time (HH:MM) -> site begin-time string, see _time_12h
+        self._time_12h_cache = {}
+
+    @classmethod
+    async def create(cls, config_file='booking_config.json'):
+        """Construct from inside an event loop, reading config and .env on a worker thread"""
+        return await asyncio.to_thread(cls, config_file)
         
     def load_config(self, config_file):
         """Load booking configuration from JSON file, with .env overrides"""
         self._load_dotenv()
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            mtime = os.stat(config_file).st_mtime_ns
         except FileNotFoundError:
             logger.warning(f"Config file {config_file} not found, using defaults")
             config = self.get_default_config()
+        else:
+            cached = _CONFIG_CACHE.get(config_file)
+            if cached is None or cached[0] != mtime:
+                with open(config_file, 'r') as f:
+                    cached = (mtime, json.load(f))
+                _CONFIG_CACHE[config_file] = cached
+            config = copy.deepcopy(cached[1])
 
         # Override user_info with environment variables if set
         env_map = {
@@ -47,20 +265,29 @@ class TeeTimeBooker:
             if value:
                 config['user_info'][key] = value
 
+        # HEADED=1 opens a visible browser for debugging without editing the config
+        if os.environ.get('HEADED') == '1':
+            config['automation']['headless'] = False
+
         return config
 
     def _load_dotenv(self):
-        """Load .env file from the script directory if it exists"""
-        env_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
+        """Load .env file from the script directory if it exists (once per process)"""
+        global _dotenv_loaded
+        if _dotenv_loaded:
+            return
+        _dotenv_loaded = True
         try:
-            with open(env_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        os.environ.setdefault(key.strip(), value.strip())
+            with open(_ENV_PATH) as f:
+                data = f.read()
         except FileNotFoundError:
-            pass
+            return
+        for line in data.splitlines():
+            # One partition per line covers the blank, comment and no-'=' checks
+            key, sep, value = line.partition('=')
+            key = key.strip()
+            if sep and key and not key.startswith('#'):
+                os.environ.setdefault(key, value.strip())
     
     def get_default_config(self):
         """Return default configuration"""
@@ -80,12 +307,15 @@ class TeeTimeBooker:
             "automation": {
                 "check_interval_minutes": 5,
                 "auto_submit": False,  # Set to True to auto-submit bookings
-                "headless": False  # Set to True to run browser in background
+                "headless": True,  # Set to False to watch the browser while debugging
+                "debug_screenshots": False,  # Save a JPEG at each booking step
+                "wait_for_window": False,  # Sleep until the next booking window before the first check
+                "cdp_endpoint": None  # e.g. "http://localhost:9222" to reuse a running Chromium
             }
         }
     
-    async def wait_for_booking_window(self):
-        """Wait until the booking window opens (usually midnight or 6 AM)"""
+    def _next_window(self):
+        """Return (next_release, seconds until it) for the next booking window opening"""
         # Adjust this based on when Charleston Municipal releases new tee times
         booking_hour = 0  # Midnight
         booking_minute = 0
@@ -96,12 +326,290 @@ class TeeTimeBooker:
         if now >= next_release:
             next_release += timedelta(days=1)
         
-        wait_seconds = (next_release - now).total_seconds()
+        return next_release, (next_release - now).total_seconds()
+
+    async def wait_for_booking_window(self, prewarm_seconds=0):
+        """
+        Wait until the booking window opens (usually midnight or 6 AM). With
+        prewarm_seconds, prewarm() runs that long before the opening so the
+        first attempt doesn't pay for launch, navigation and login.
+        """
+        next_release, wait_seconds = self._next_window()
         logger.info(f"Waiting until {next_release.strftime('%Y-%m-%d %H:%M:%S')} to check for tee times...")
         logger.info(f"Time until check: {wait_seconds/3600:.2f} hours")
         
-        await asyncio.sleep(wait_seconds)
+        if prewarm_seconds and wait_seconds > prewarm_seconds:
+            await asyncio.sleep(wait_seconds - prewarm_seconds)
+            await self.prewarm()
+
+        # Sleep to just short of the edge, re-anchored on the wall clock so an NTP
+        # step or DST change during the long wait can't make us miss it, then poll
+        # so the first attempt fires within ~50ms of the release
+        remaining = (next_release - datetime.now()).total_seconds()
+        await asyncio.sleep(max(0, remaining - WINDOW_EDGE_SECONDS))
+        while datetime.now() < next_release:
+            await asyncio.sleep(0.05)
     
+    async def _new_context(self, browser):
+        """Create a browser context with non-essential resources blocked, static ones cached, and the last saved session"""
+        context = await browser.new_context(
+            viewport={'width': 1280, 'height': 720},
+            device_scale_factor=1,
+            storage_state=_STORAGE_STATE_PATH if os.path.exists(_STORAGE_STATE_PATH) else None
+        )
+        # Fail a missing element in seconds, not Playwright's 30s default; the
+        # waits that really can take longer pass their own timeout
+        context.set_default_timeout(ACTION_TIMEOUT_MS)
+        context.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+        await context.route('**/*', _handle_route)
+        await context.add_init_script(DISABLE_ANIMATIONS_SCRIPT)
+        await context.add_init_script(CACHE_INPUT_SETTER_SCRIPT)
+        return context
+
+    async def _wait_for_step(self, page, selector, state='visible', timeout=3000):
+        """
+        Wait for the next step's element instead of a fixed sleep. The timeout
+        matches the sleep it replaces, so a miss falls through just as before.
+        """
+        await page.wait_for_load_state('domcontentloaded')
+        try:
+            await page.wait_for_selector(selector, state=state, timeout=timeout)
+        except PlaywrightTimeoutError:
+            pass
+
+    async def _wait_for_login(self, page, timeout=3000):
+        """
+        After clicking Login, return as soon as the login form is gone or the
+        Active Session Alert shows, rather than always waiting for the alert.
+        """
+        await page.wait_for_load_state('domcontentloaded')
+        try:
+            await page.wait_for_function(LOGIN_SETTLED_JS, timeout=timeout)
+        except PlaywrightTimeoutError:
+            pass
+
+    async def _submit_login(self, page, username, password, timeout=3000):
+        """
+        Fill and submit the login form, then get past the "Active Session Alert"
+        if it appears. Both fields are set in one evaluate when already rendered;
+        otherwise auto-waiting locator fills are used, skipping a field that
+        never shows up.
+        """
+        filled = await page.evaluate(FILL_LOGIN_JS, {'username': username, 'password': password})
+        if not filled:
+            for selector, value in zip(LOGIN_FIELD_SELECTORS, (username, password)):
+                try:
+                    await page.locator(selector).first.fill(value, timeout=timeout)
+                except PlaywrightTimeoutError:
+                    pass
+
+        try:
+            await page.locator(LOGIN_BUTTON).first.click(timeout=timeout)
+        except PlaywrightTimeoutError:
+            pass
+        else:
+            await self._wait_for_login(page)
+
+        continue_btn = await page.query_selector(CONTINUE_WITH_LOGIN)
+        if continue_btn:
+            logger.info("Active session alert, clicking Continue with Login...")
+            await continue_btn.click()
+            await self._wait_for_step(page, CONTINUE_WITH_LOGIN, state='detached')
+
+    async def _debug_screenshot(self, page, name):
+        """Save `name`.jpg if automation.debug_screenshots is enabled"""
+        if not self.config['automation'].get('debug_screenshots'):
+            return
+        path = f'{name}.jpg'
+        await page.screenshot(path=path, type='jpeg', quality=60, full_page=False)
+        logger.info(f"Screenshot saved: {path}")
+
+    async def _open_search_page(self, page):
+        """Navigate to the search page and wait for the filter form's date field instead of network idle"""
+        await page.goto(self.booking_url, wait_until='domcontentloaded')
+        await page.wait_for_selector(DATE_INPUT_SELECTOR, state='attached', timeout=15000)
+
+    def _time_12h(self, target_time):
+        """
+        Format HH:MM (24h) as the site's "HH:MM am/pm" begin-time string.
+        Memoized, since monitor_and_book retries with the same target_time.
+        """
+        time_12h = self._time_12h_cache.get(target_time)
+        if time_12h is None:
+            hour, minute = target_time.split(':')
+            hour = int(hour)
+            period = 'am' if hour < 12 else 'pm'
+            time_12h = f"{hour % 12 or 12:02d}:{minute} {period}"
+            self._time_12h_cache[target_time] = time_12h
+        return time_12h
+
+    async def _wait_for_detached(self, handle, timeout):
+        """
+        Wait for an element from the current document to go away. A navigation
+        detaches it, which Playwright reports as a plain Error rather than the
+        'hidden' state, so that counts as done too (TimeoutError is an Error and
+        is checked first).
+        """
+        try:
+            await handle.wait_for_element_state('hidden', timeout=timeout)
+        except PlaywrightTimeoutError:
+            logger.warning("Previous results still shown after Search")
+        except PlaywrightError:
+            pass
+
+    async def _click_search(self, page):
+        """
+        Click the sidebar Search button. Matching by button role skips the nav
+        menu's Search link; returns False if no such button shows up in time.
+        """
+        try:
+            await page.get_by_role('button', name='Search', exact=True).first.click(timeout=3000)
+        except PlaywrightTimeoutError:
+            return False
+        return True
+
+    async def _apply_filters(self, page, players, target_date, time_12h, screenshot=None):
+        """
+        Set player count, date and begin time in one evaluate, then click Search
+        and wait for the results. Used for the first search and every re-search.
+        """
+        # At DEBUG the same round-trip also enumerates selects/inputs for the log
+        filters = await page.evaluate(SET_FILTERS_JS, {
+            'players': players, 'date': target_date, 'time': time_12h,
+            'debug': logger.isEnabledFor(logging.DEBUG),
+        })
+
+        for s in filters['selects']:
+            logger.debug("Found select[%d] name='%s' id='%s' options=%s", s['index'], s['name'], s['id'], s['options'][:6])
+        for inp in filters['inputs']:
+            logger.debug("Found input[%d] type='%s' name='%s' id='%s' value='%s'", inp['index'], inp['type'], inp['name'], inp['id'], inp['value'])
+
+        player_set = filters['playerResult']
+        if player_set.get('found'):
+            logger.info(f"Selected {player_set['selected']} player(s) via {player_set['name']}")
+        else:
+            logger.warning("Could not find/set player count dropdown")
+
+        date_set = filters['dateResult']
+        if date_set.get('found'):
+            logger.info(f"Set date to {target_date} via {date_set.get('name') or date_set.get('id')}")
+        else:
+            logger.warning("Could not find date input field")
+
+        # The site uses a text input (name=begintime), not a dropdown
+        if filters['timeResult'].get('found'):
+            logger.info(f"Set begin time to {time_12h}")
+        else:
+            logger.warning(f"Could not find begintime input field")
+
+        if screenshot:
+            await self._debug_screenshot(page, screenshot)
+
+        # A re-search in place starts from the previous results; remember one of
+        # their cart buttons so the wait below can't be satisfied by the old table
+        stale_result = await page.query_selector(CART_BUTTON)
+
+        # Sidebar Search button, not the nav link
+        if await self._click_search(page):
+            logger.info("Clicked 'Search'")
+            if stale_result:
+                await self._wait_for_detached(stale_result, NAVIGATION_TIMEOUT_MS)
+            await self._wait_for_step(page, CART_BUTTON)
+        else:
+            logger.warning("Could not find Search button")
+        if stale_result:
+            try:
+                await stale_result.dispose()
+            except PlaywrightError:
+                pass  # its document is gone already
+
+    async def _find_cart_button(self, page):
+        """Return the Available cart button's ElementHandle, or None"""
+        handle = await page.evaluate_handle(FIND_CART_BUTTON_JS)
+        button = handle.as_element()
+        if button is None:
+            await handle.dispose()
+        return button
+
+    async def _launch_browser(self, pw):
+        """
+        Connect to the Chromium at automation.cdp_endpoint if one is configured,
+        skipping the browser cold start; otherwise launch a new one.
+        """
+        endpoint = self.config['automation'].get('cdp_endpoint')
+        if endpoint:
+            logger.info(f"Connecting to running Chromium at {endpoint}")
+            return await pw.chromium.connect_over_cdp(endpoint)
+        headless = self.config['automation']['headless']
+        return await pw.chromium.launch(
+            headless=headless,
+            args=list(HEADLESS_CHROMIUM_ARGS if headless else CHROMIUM_ARGS)
+        )
+
+    async def _close_browser(self, browser, context):
+        """Save the session, close our context; only close the browser itself if we launched it"""
+        if context:
+            try:
+                await context.storage_state(path=_STORAGE_STATE_PATH)
+            except Exception as e:
+                logger.debug("Could not save storage state: %s", e)
+            await context.close()
+        if browser and not self.config['automation'].get('cdp_endpoint'):
+            await browser.close()
+
+    async def _setup(self):
+        """Launch Playwright, Chromium, a context and a page, kept on self for reuse across attempts"""
+        self._pw = await async_playwright().start()
+        try:
+            self._browser = await self._launch_browser(self._pw)
+            self._context = await self._new_context(self._browser)
+            self._page = await self._new_page()
+        except Exception:
+            # Don't leave a half-built session behind (e.g. a bad saved storage
+            # state failing new_context): callers treat a set _browser as ready
+            try:
+                await self._teardown()
+            except Exception as e:
+                logger.debug("Cleanup after failed setup also failed: %s", e)
+            raise
+
+    async def _new_page(self):
+        """Open the shared page on the shared context, watching for renderer crashes"""
+        page = await self._context.new_page()
+        page.on('crash', self._on_page_crash)
+        self._page_crashed = False
+        return page
+
+    def _on_page_crash(self, page):
+        """A crashed page stays open but unusable, so flag it for _ensure_page to replace"""
+        logger.warning("Page crashed")
+        self._page_crashed = True
+
+    async def _teardown(self):
+        """Close everything _setup opened"""
+        try:
+            await self._close_browser(self._browser, self._context)
+            if self._pw:
+                await self._pw.stop()
+        finally:
+            self._pw = self._browser = self._context = self._page = None
+
+    async def _ensure_page(self):
+        """
+        Return the shared page, replacing it if it was closed or crashed and
+        relaunching the browser if it disconnected since the last attempt
+        """
+        if not self._browser.is_connected():
+            logger.warning("Browser disconnected, relaunching...")
+            await self._pw.stop()
+            await self._setup()
+        elif self._page.is_closed() or self._page_crashed:
+            logger.warning("Page was closed or crashed, opening a new one...")
+            if not self._page.is_closed():
+                await self._page.close()
+            self._page = await self._new_page()
+        return self._page
+
     async def book_tee_time(self, target_date, target_time):
         """
         Main booking function - navigates site and books tee time
@@ -110,177 +618,92 @@ class TeeTimeBooker:
             target_date: Date to book (MM/DD/YYYY format)
             target_time: Time to book (HH:MM format, 24h)
         """
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=self.config['automation']['headless']
-            )
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080}
-            )
-            page = await context.new_page()
+        # A prewarm() call may already have the browser up and the search page loaded
+        if self._browser is None:
+            await self._setup()
+        try:
+            return await self._attempt(target_date, target_time)
+        finally:
+            await self._teardown()
 
-            try:
-                logger.info("Navigating to Charleston Municipal booking site...")
-                await page.goto(self.booking_url, wait_until='networkidle')
-                await page.wait_for_timeout(2000)
-
-                # Login first so cart buttons show as available
-                password = self.config['user_info'].get('password', '')
-                username = self.config['user_info'].get('username', '') or self.config['user_info'].get('email', '')
-
-                if username and password:
-                    sign_in_link = await page.query_selector('a:has-text("SIGN IN"), a:has-text("Sign In"), a:has-text("Login")')
-                    if sign_in_link:
-                        await sign_in_link.click()
-                        await page.wait_for_timeout(2000)
-
-                    if await page.query_selector('input[type="password"]'):
-                        logger.info("Logging in before search...")
-                        username_input = await page.query_selector('input[name*="user"], input[id*="user"], input[type="text"]')
-                        if username_input:
-                            await username_input.fill(username)
-                        pass_input = await page.query_selector('input[type="password"]')
-                        if pass_input:
-                            await pass_input.fill(password)
-                        login_btn = await page.query_selector('button:has-text("Login"), input[type="submit"]')
-                        if login_btn:
-                            await login_btn.click()
-                            await page.wait_for_timeout(3000)
-
-                        # Handle "Active Session Alert"
-                        continue_btn = await page.query_selector('button:has-text("Continue with Login"), a:has-text("Continue with Login")')
-                        if continue_btn:
-                            logger.info("Active session alert, clicking Continue with Login...")
-                            await continue_btn.click()
-                            await page.wait_for_timeout(3000)
-
-                        logger.info("Logged in, navigating back to search...")
-                        await page.goto(self.booking_url, wait_until='networkidle')
-                        await page.wait_for_timeout(2000)
-
-                await page.screenshot(path='booking_page_1.png')
-                logger.info("Screenshot saved: booking_page_1.png")
-
-                # --- Step 1: Set search filters ---
-
-                # Debug: log all selects and inputs on the page
-                select_info = await page.evaluate('''() => {
-                    const selects = document.querySelectorAll('select');
-                    return Array.from(selects).map((s, i) => ({
-                        index: i,
-                        name: s.name,
-                        id: s.id,
-                        options: Array.from(s.options).map(o => ({value: o.value, text: o.text.trim()}))
-                    }));
-                }''')
-                for s in select_info:
-                    logger.info(f"Found select[{s['index']}] name='{s['name']}' id='{s['id']}' options={s['options'][:6]}")
+    async def prewarm(self):
+        """
+        Launch the browser (if needed), load the search page and log in ahead
+        of time, so the next attempt re-searches in place at once. Best effort:
+        on failure the attempt just starts cold.
+        """
+        try:
+            if self._browser is None:
+                await self._setup()
+            page = await self._ensure_page()
+            username, password = self._credentials()
+            await self._prepare_search_page(page, username, password)
+            self._search_page_loaded = True
+            logger.info("Browser warmed up on the search page")
+        except Exception as e:
+            logger.warning(f"Prewarm failed, first attempt will start cold: {e}")
+
+    def _credentials(self):
+        """Return (username, password) for the site login; username falls back to email"""
+        user_info = self.config['user_info']
+        return user_info.get('username', '') or user_info.get('email', ''), user_info.get('password', '')
+
+    async def _prepare_search_page(self, page, username, password):
+        """Navigate to the search page, logging in first if the saved session isn't live"""
+        logger.info("Navigating to Charleston Municipal booking site...")
+        await self._open_search_page(page)
+
+        # Login first so cart buttons show as available. One probe for either the
+        # sign-in link or the login form; neither means the saved session is live.
+        if username and password and await page.query_selector(SIGN_IN_OR_LOGIN_FORM):
+            sign_in_link = await page.query_selector(SIGN_IN_LINK)
+            if sign_in_link:
+                await sign_in_link.click()
+                await self._wait_for_step(page, PASSWORD_INPUT, timeout=2000)
+
+            if await page.query_selector(PASSWORD_INPUT):
+                logger.info("Logging in before search...")
+                await self._submit_login(page, username, password)
+
+                logger.info("Logged in, navigating back to search...")
+                await self._open_search_page(page)
+
+    async def _attempt(self, target_date, target_time):
+        """
+        One booking attempt on the page opened by _setup. Starts by (re)loading
+        the search page, so it can be called repeatedly on the same browser;
+        after an attempt that found nothing it re-searches in place instead.
+        Returns True if a tee time was booked, False if none were available.
+        """
+        page = await self._ensure_page()
 
-                input_info = await page.evaluate('''() => {
-                    const inputs = document.querySelectorAll('input');
-                    return Array.from(inputs).map((inp, i) => ({
-                        index: i, type: inp.type, name: inp.name, id: inp.id, value: inp.value
-                    }));
-                }''')
-                for inp in input_info:
-                    logger.info(f"Found input[{inp['index']}] type='{inp['type']}' name='{inp['name']}' id='{inp['id']}' value='{inp['value']}'")
-
-                # Number of players - use JavaScript to set value and trigger change
-                players = str(self.config['preferences']['num_players'])
-                player_set = await page.evaluate(f'''(target) => {{
-                    const selects = document.querySelectorAll('select');
-                    for (const s of selects) {{
-                        const opts = Array.from(s.options).map(o => o.text.trim().toLowerCase());
-                        if (opts.some(o => /^[1-4]$/.test(o))) {{
-                            for (const o of s.options) {{
-                                if (o.text.trim() === target || o.value === target) {{
-                                    s.value = o.value;
-                                    s.dispatchEvent(new Event('change', {{bubbles: true}}));
-                                    return {{found: true, name: s.name, selected: o.text.trim()}};
-                                }}
-                            }}
-                        }}
-                    }}
-                    return {{found: false}};
-                }}''', players)
-                if player_set.get('found'):
-                    logger.info(f"Selected {player_set['selected']} player(s) via {player_set['name']}")
-                else:
-                    logger.warning("Could not find/set player count dropdown")
-
-                # Date field - try multiple approaches
-                date_set = await page.evaluate(f'''(target) => {{
-                    const inputs = document.querySelectorAll('input');
-                    for (const inp of inputs) {{
-                        if (inp.type === 'date' || inp.name.toLowerCase().includes('date') || inp.id.toLowerCase().includes('date')) {{
-                            const nativeSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
-                            nativeSetter.call(inp, target);
-                            inp.dispatchEvent(new Event('input', {{bubbles: true}}));
-                            inp.dispatchEvent(new Event('change', {{bubbles: true}}));
-                            return {{found: true, name: inp.name, id: inp.id}};
-                        }}
-                    }}
-                    return {{found: false}};
-                }}''', target_date)
-                if date_set.get('found'):
-                    logger.info(f"Set date to {target_date} via {date_set.get('name') or date_set.get('id')}")
-                else:
-                    logger.warning("Could not find date input field")
-
-                # Begin time — format to match the site's "HH:MM am/pm" pattern
-                hour = int(target_time.split(':')[0])
-                minute = target_time.split(':')[1]
-                period = 'am' if hour < 12 else 'pm'
-                display_hour = hour if hour <= 12 else hour - 12
-                if display_hour == 0:
-                    display_hour = 12
-                time_12h = f"{display_hour:02d}:{minute} {period}"
-
-                # The site uses a text input (name=begintime), not a dropdown
-                time_set = await page.evaluate(f'''(target) => {{
-                    const inp = document.querySelector('input[name="begintime"], input#begintime');
-                    if (inp) {{
-                        const nativeSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
-                        nativeSetter.call(inp, target);
-                        inp.dispatchEvent(new Event('input', {{bubbles: true}}));
-                        inp.dispatchEvent(new Event('change', {{bubbles: true}}));
-                        return {{found: true, name: inp.name, value: target}};
-                    }}
-                    return {{found: false}};
-                }}''', time_12h)
-                if time_set.get('found'):
-                    logger.info(f"Set begin time to {time_12h}")
-                else:
-                    logger.warning(f"Could not find begintime input field")
-
-                await page.screenshot(path='booking_page_2.png')
-                await page.wait_for_timeout(500)
-
-                # --- Step 2: Click Search (sidebar button, not nav link) ---
-                search_clicked = await page.evaluate('''() => {
-                    // Target the sidebar Search button specifically, not the nav menu
-                    const buttons = document.querySelectorAll('button, input[type="submit"], input[type="button"]');
-                    for (const el of buttons) {
-                        const text = (el.textContent || el.value || '').trim();
-                        if (text === 'Search') {
-                            el.click();
-                            return {found: true, text: text, tag: el.tagName};
-                        }
-                    }
-                    return {found: false};
-                }''')
-                if search_clicked.get('found'):
-                    logger.info(f"Clicked '{search_clicked['text']}'")
-                    await page.wait_for_timeout(3000)
-                else:
-                    logger.warning("Could not find Search button")
+        try:
+            username, password = self._credentials()
+
+            reuse_search_page = self._search_page_loaded and await page.query_selector(DATE_INPUT_SELECTOR)
+            self._search_page_loaded = False
+            if reuse_search_page:
+                # Already loaded and logged in (prewarm or an empty attempt): re-search on this page
+                logger.info("Re-searching on the already loaded search page...")
+            else:
+                await self._prepare_search_page(page, username, password)
 
-                await page.screenshot(path='booking_page_3.png')
+            await self._debug_screenshot(page, 'booking_page_1')
 
-                # --- Step 3: Find and click on an available tee time result ---
-                logger.info("Looking for available tee times...")
+            # --- Steps 1-2: Set search filters and click Search ---
 
-                # Debug: log the result table HTML structure
+            time_12h = self._time_12h(target_time)
+            players = str(self.config['preferences']['num_players'])
+            await self._apply_filters(page, players, target_date, time_12h, screenshot='booking_page_2')
+
+            await self._debug_screenshot(page, 'booking_page_3')
+
+            # --- Step 3: Find and click on an available tee time result ---
+            logger.info("Looking for available tee times...")
+            debug = logger.isEnabledFor(logging.DEBUG)
+
+            # Debug: log the result table HTML structure
+            if debug:
                 table_debug = await page.evaluate('''() => {
                     const rows = document.querySelectorAll('tr');
                     const info = [];
@@ -298,191 +721,151 @@ class TeeTimeBooker:
                     return info;
                 }''')
                 for row in table_debug:
-                    logger.info(f"Row: {row.get('text', '')} | Link: {row.get('linkHref', 'none')} | HTML: {row.get('firstCellHTML', '')[:100]}")
-
-                # Use Playwright click on the first link inside a result row (the green icon)
-                clicked_result = await page.evaluate('''() => {
-                    const rows = document.querySelectorAll('tr');
-                    for (const row of rows) {
-                        const text = row.textContent || '';
-                        if (text.includes('Time') && text.includes('Holes') && text.includes('Course')) continue;
-                        if (text.includes('Available')) {
-                            const link = row.querySelector('td a');
-                            if (link) {
-                                return {found: true, href: link.href, text: text.replace(/\\s+/g, ' ').trim().substring(0, 100)};
-                            }
+                    logger.debug("Row: %s | Link: %s | HTML: %s", row.get('text', ''), row.get('linkHref', 'none'), row.get('firstCellHTML', '')[:100])
+
+            # Use Playwright click on the first link inside a result row (the green icon)
+            clicked_result = await page.evaluate('''() => {
+                const rows = document.querySelectorAll('tr');
+                for (const row of rows) {
+                    const text = row.textContent || '';
+                    if (text.includes('Time') && text.includes('Holes') && text.includes('Course')) continue;
+                    if (text.includes('Available')) {
+                        const link = row.querySelector('td a');
+                        if (link) {
+                            return {found: true, href: link.href, text: text.replace(/\\s+/g, ' ').trim().substring(0, 100)};
                         }
                     }
-                    return {found: false};
+                }
+                return {found: false};
+            }''')
+
+            # Nothing bookable (the usual case while polling before release): stop here
+            if not clicked_result.get('found'):
+                logger.warning("No available tee times found in results")
+                self._search_page_loaded = True
+                return False
+            logger.info(f"Found tee time: {clicked_result['text']}")
+
+            # Debug: log all cart buttons and their classes to find the "Available" one
+            if debug:
+                btn_info = await page.evaluate('''() => {
+                    const buttons = document.querySelectorAll('a.cart-button');
+                    return Array.from(buttons).map((b, i) => ({
+                        index: i,
+                        classes: b.className,
+                        title: b.title || b.getAttribute('data-original-title') || '',
+                        ariaLabel: b.getAttribute('aria-label') || '',
+                        text: b.textContent.trim(),
+                        parentRow: b.closest('tr') ? b.closest('tr').textContent.replace(/\\s+/g, ' ').trim().substring(0, 60) : ''
+                    }));
                 }''')
+                for btn in btn_info:
+                    logger.debug("Cart button[%d]: classes='%s' title='%s' aria='%s' row='%s'", btn['index'], btn['classes'], btn['title'], btn['ariaLabel'], btn['parentRow'])
 
-                if clicked_result.get('found'):
-                    logger.info(f"Found tee time: {clicked_result['text']}")
-
-                    # Debug: log all cart buttons and their classes to find the "Available" one
-                    btn_info = await page.evaluate('''() => {
-                        const buttons = document.querySelectorAll('a.cart-button');
-                        return Array.from(buttons).map((b, i) => ({
-                            index: i,
-                            classes: b.className,
-                            title: b.title || b.getAttribute('data-original-title') || '',
-                            ariaLabel: b.getAttribute('aria-label') || '',
-                            text: b.textContent.trim(),
-                            parentRow: b.closest('tr') ? b.closest('tr').textContent.replace(/\\s+/g, ' ').trim().substring(0, 60) : ''
-                        }));
-                    }''')
-                    for btn in btn_info:
-                        logger.info(f"Cart button[{btn['index']}]: classes='{btn['classes']}' title='{btn['title']}' aria='{btn['ariaLabel']}' row='{btn['parentRow']}'")
-
-                    # Click the Available cart button (has "success" class, not "error")
-                    cart_btn = await page.query_selector('a.cart-button:not(.error)')
-                    if not cart_btn:
-                        # Try finding by success class
-                        cart_btn = await page.query_selector('a.cart-button.success')
-                    if not cart_btn:
-                        # Last resort: find any cart button with "Available" in its attributes
-                        cart_btn = await page.query_selector('a.cart-button[title*="Available"], a.cart-button[aria-label*="Available"]')
-
-                    if cart_btn:
-                        await cart_btn.click()
-                        logger.info("Clicked available cart button via Playwright")
-                    else:
-                        logger.warning("Could not find an available cart button, trying first one")
-                        await page.click('tr:has-text("Available") a.cart-button')
-                    await page.wait_for_timeout(3000)
-
-                if clicked_result.get('found'):
-                    logger.info(f"Clicked tee time: {clicked_result['text']}")
-                    await page.wait_for_timeout(3000)
-                else:
-                    logger.warning("No available tee times found in results")
-                    await browser.close()
+            # Click the Available cart button (has "success" class, not "error")
+            cart_btn = await self._find_cart_button(page)
+
+            if cart_btn:
+                await cart_btn.click()
+                logger.info("Clicked available cart button via Playwright")
+            else:
+                logger.warning("Could not find an available cart button, trying first one")
+                try:
+                    await page.locator(AVAILABLE_ROW_CART_BUTTON).first.click(timeout=5000)
+                except PlaywrightTimeoutError:
+                    logger.warning("No clickable cart button in the Available rows")
                     return False
+            await self._wait_for_step(page, AFTER_CART_CLICK)
+            logger.info(f"Clicked tee time: {clicked_result['text']}")
 
-                # Handle login page if redirected after clicking tee time
-                if 'login' in page.url.lower() or await page.query_selector('input[type="password"]'):
-                    logger.info("Login page detected, signing in...")
-                    username_input = await page.query_selector('input[name*="user"], input[id*="user"], input[type="text"]')
-                    if username_input:
-                        await username_input.fill(username)
-                    pass_input = await page.query_selector('input[type="password"]')
-                    if pass_input:
-                        await pass_input.fill(password)
-                    login_btn = await page.query_selector('button:has-text("Login"), input[type="submit"]')
-                    if login_btn:
-                        await login_btn.click()
-                        await page.wait_for_timeout(3000)
-
-                    # Handle "Active Session Alert" - click "Continue with Login"
-                    continue_btn = await page.query_selector('button:has-text("Continue with Login"), a:has-text("Continue with Login")')
-                    if continue_btn:
-                        logger.info("Active session alert detected, clicking Continue with Login...")
-                        await continue_btn.click()
-                        await page.wait_for_timeout(3000)
-
-                    await page.screenshot(path='booking_page_after_login2.png')
-                    logger.info("Screenshot saved: booking_page_after_login2.png")
-
-                    # After login, go back to search and re-find the tee time
-                    logger.info("Logged in, navigating back to search for tee time...")
-                    await page.goto(self.booking_url, wait_until='networkidle')
-                    await page.wait_for_timeout(2000)
-
-                    # Re-set filters
-                    await page.evaluate(f'''(target) => {{
-                        const selects = document.querySelectorAll('select');
-                        for (const s of selects) {{
-                            const opts = Array.from(s.options).map(o => o.text.trim());
-                            if (opts.some(o => /^[1-4]$/.test(o))) {{
-                                for (const o of s.options) {{
-                                    if (o.text.trim() === target || o.value === target) {{
-                                        s.value = o.value;
-                                        s.dispatchEvent(new Event('change', {{bubbles: true}}));
-                                    }}
-                                }}
-                            }}
-                        }}
-                    }}''', players)
-
-                    await page.evaluate(f'''(target) => {{
-                        const inputs = document.querySelectorAll('input');
-                        for (const inp of inputs) {{
-                            if (inp.type === 'date' || inp.name.toLowerCase().includes('date') || inp.id.toLowerCase().includes('date')) {{
-                                const nativeSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
-                                nativeSetter.call(inp, target);
-                                inp.dispatchEvent(new Event('input', {{bubbles: true}}));
-                                inp.dispatchEvent(new Event('change', {{bubbles: true}}));
-                            }}
-                        }}
-                    }}''', target_date)
-
-                    # Click Search
-                    await page.evaluate('''() => {
-                        const buttons = document.querySelectorAll('button, input[type="submit"], input[type="button"]');
-                        for (const el of buttons) {
-                            const text = (el.textContent || el.value || '').trim();
-                            if (text === 'Search') { el.click(); return; }
-                        }
-                    }''')
-                    await page.wait_for_timeout(3000)
-
-                    await page.screenshot(path='booking_page_5.png')
-                    logger.info("Screenshot saved: booking_page_5.png")
-
-                    # Re-click the available tee time (now logged in, should add to cart)
-                    cart_btn2 = await page.query_selector('a.cart-button:not(.error)') or await page.query_selector('a.cart-button.success')
-                    if cart_btn2:
-                        await cart_btn2.click()
-                        logger.info("Re-clicked available cart button after login")
-                        await page.wait_for_timeout(3000)
-                    else:
-                        logger.warning("Could not find available tee time after re-search")
-
-                    await page.screenshot(path='booking_page_6.png')
-                    logger.info("Screenshot saved: booking_page_6.png")
-
-                # Handle "Tee Time Member Selection" - click Continue (appears whether or not login was needed)
-                continue_member_btn = await page.query_selector('button:has-text("Continue"), input[value="Continue"]')
-                if continue_member_btn:
-                    logger.info("Member selection page detected, clicking Continue...")
-                    await continue_member_btn.click()
-                    await page.wait_for_timeout(3000)
-                    await page.screenshot(path='booking_page_7.png')
-                    logger.info("Screenshot saved: booking_page_7.png")
-
-                await page.screenshot(path='booking_page_4.png')
-
-                # --- Step 4: Handle credit card / final confirmation page ---
-                # The final page shows credit card info and a "Continue" button to confirm
-                if self.config['automation']['auto_submit']:
-                    final_continue = await page.query_selector(
-                        'button:has-text("Continue"), input[value="Continue"], '
-                        'button:has-text("Book"), button:has-text("Submit"), '
-                        'button:has-text("Checkout"), input[value*="Book"]'
-                    )
-                    if final_continue:
-                        await final_continue.click()
-                        logger.info("BOOKING CONFIRMED! Clicked final Continue.")
-                        await page.wait_for_timeout(5000)
-                        await page.screenshot(path='booking_confirmation.png')
-                        logger.info("Screenshot saved: booking_confirmation.png")
-                    else:
-                        logger.warning("Could not find final confirm button")
-                else:
-                    logger.info("Auto-submit is disabled. Please manually complete the booking.")
-                    logger.info("Browser will remain open for 120 seconds...")
-                    await page.wait_for_timeout(120000)
+            # Handle login page if redirected after clicking tee time
+            if 'login' in page.url.lower() or await page.query_selector(PASSWORD_INPUT):
+                logger.info("Login page detected, signing in...")
+                await self._submit_login(page, username, password)
 
-                return True
+                await self._debug_screenshot(page, 'booking_page_after_login2')
 
-            except Exception as e:
-                logger.error(f"Error during booking: {str(e)}")
-                await page.screenshot(path='booking_error.png')
-                raise
+                # After login, go back to search and re-find the tee time
+                logger.info("Logged in, navigating back to search for tee time...")
+                await self._open_search_page(page)
+
+                # Re-set filters and search again
+                await self._apply_filters(page, players, target_date, time_12h)
+
+                await self._debug_screenshot(page, 'booking_page_5')
+
+                # Re-click the available tee time (now logged in, should add to cart)
+                cart_btn2 = await self._find_cart_button(page)
+                if cart_btn2:
+                    await cart_btn2.click()
+                    logger.info("Re-clicked available cart button after login")
+                    await self._wait_for_step(page, CONTINUE_BUTTON)
+                else:
+                    logger.warning("Could not find available tee time after re-search")
+
+                await self._debug_screenshot(page, 'booking_page_6')
+
+            # Handle "Tee Time Member Selection" - click Continue (appears whether or not login was needed)
+            # Kept as a handle: a locator would re-resolve to the next page's Continue
+            continue_member = page.get_by_role('button', name='Continue')
+            continue_member_btn = await continue_member.first.element_handle() if await continue_member.count() else None
+            if continue_member_btn:
+                logger.info("Member selection page detected, clicking Continue...")
+                await continue_member_btn.click()
+                # The final page has its own Continue button, so wait for this one to go away.
+                # Navigating detaches the handle, which Playwright reports as a plain Error
+                # ("not attached"/destroyed context) rather than a timeout: the button is
+                # gone either way, so both count as done (TimeoutError subclasses Error).
+                try:
+                    await continue_member_btn.wait_for_element_state('hidden', timeout=3000)
+                except PlaywrightError:
+                    pass
+                await page.wait_for_load_state('domcontentloaded')
+                await self._debug_screenshot(page, 'booking_page_7')
+
+            await self._debug_screenshot(page, 'booking_page_4')
+
+            # --- Step 4: Handle credit card / final confirmation page ---
+            # The final page shows credit card info and a "Continue" button to confirm
+            if self.config['automation']['auto_submit']:
+                final_continue = page.get_by_role('button', name=FINAL_CONFIRM_NAME)
+                # wait_for_url returns at once if the current URL already matches,
+                # so only count a navigation away from this page
+                start_url = page.url
+                try:
+                    await final_continue.first.click(timeout=5000)
+                except PlaywrightTimeoutError:
+                    logger.warning("Could not find final confirm button")
+                else:
+                    logger.info("BOOKING CONFIRMED! Clicked final Continue.")
+                    try:
+                        await page.wait_for_url(
+                            lambda u: u != start_url and _is_confirmation_url(u), timeout=15000)
+                    except PlaywrightTimeoutError:
+                        pass
+                    await self._debug_screenshot(page, 'booking_confirmation')
+            else:
+                logger.info("Auto-submit is disabled. Please manually complete the booking.")
+                logger.info("Browser will remain open for up to 120 seconds...")
+                start_url = page.url
+                try:
+                    await page.wait_for_url(
+                        lambda u: u != start_url and _is_confirmation_url(u), timeout=120000)
+                    logger.info("Confirmation page reached")
+                except PlaywrightTimeoutError:
+                    pass
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Error during booking: {str(e)}")
+            # Best effort: a crashed or closed page must not replace the real error
+            try:
+                await page.screenshot(path='booking_error.jpg', type='jpeg', quality=60, timeout=5000)
+            except Exception as shot_error:
+                logger.debug("Could not save booking_error.jpg: %s", shot_error)
+            raise
 
-            finally:
-                await browser.close()
-    
     async def search_tee_times(self, target_date, num_players=1):
         """
         Search for all available tee times on a given date.
@@ -495,68 +878,17 @@ class TeeTimeBooker:
             List of dicts with keys: time, holes, course, players
         """
         async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=self.config['automation']['headless']
-            )
-            context = await browser.new_context(viewport={'width': 1920, 'height': 1080})
+            browser = await self._launch_browser(p)
+            context = await self._new_context(browser)
             page = await context.new_page()
 
             try:
-                await page.goto(self.booking_url, wait_until='networkidle')
-                await page.wait_for_timeout(2000)
-
-                # Set number of players
-                players = str(num_players)
-                await page.evaluate(f'''(target) => {{
-                    const selects = document.querySelectorAll('select');
-                    for (const s of selects) {{
-                        const opts = Array.from(s.options).map(o => o.text.trim());
-                        if (opts.some(o => /^[1-4]$/.test(o))) {{
-                            for (const o of s.options) {{
-                                if (o.text.trim() === target || o.value === target) {{
-                                    s.value = o.value;
-                                    s.dispatchEvent(new Event('change', {{bubbles: true}}));
-                                }}
-                            }}
-                        }}
-                    }}
-                }}''', players)
-
-                # Set date
-                await page.evaluate(f'''(target) => {{
-                    const inputs = document.querySelectorAll('input');
-                    for (const inp of inputs) {{
-                        if (inp.type === 'date' || inp.name.toLowerCase().includes('date') || inp.id.toLowerCase().includes('date')) {{
-                            const nativeSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
-                            nativeSetter.call(inp, target);
-                            inp.dispatchEvent(new Event('input', {{bubbles: true}}));
-                            inp.dispatchEvent(new Event('change', {{bubbles: true}}));
-                        }}
-                    }}
-                }}''', target_date)
-
-                # Set begin time to earliest (07:00 am)
-                await page.evaluate('''() => {
-                    const inp = document.querySelector('input[name="begintime"], input#begintime');
-                    if (inp) {
-                        const nativeSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
-                        nativeSetter.call(inp, '07:00 am');
-                        inp.dispatchEvent(new Event('input', {bubbles: true}));
-                        inp.dispatchEvent(new Event('change', {bubbles: true}));
-                    }
-                }''')
+                await self._open_search_page(page)
 
-                # Click Search
-                await page.evaluate('''() => {
-                    const buttons = document.querySelectorAll('button, input[type="submit"], input[type="button"]');
-                    for (const el of buttons) {
-                        const text = (el.textContent || el.value || '').trim();
-                        if (text === 'Search') { el.click(); return; }
-                    }
-                }''')
-                await page.wait_for_timeout(3000)
+                # Filters with begin time at the earliest slot (07:00 am), then Search
+                await self._apply_filters(page, str(num_players), target_date, '07:00 am')
 
-                await page.screenshot(path='search_results.png')
+                await self._debug_screenshot(page, 'search_results')
 
                 # Scrape all available tee times from the results table
                 # The cart button has class "success" for available slots
@@ -589,36 +921,59 @@ class TeeTimeBooker:
                 return []
 
             finally:
-                await browser.close()
+                await self._close_browser(browser, context)
 
-    async def monitor_and_book(self):
+    async def monitor_and_book(self, wait_for_window=False):
         """
         Open one browser, search for tee times, and book when available.
         Retries by re-searching on the same page instead of opening new browsers.
+
+        Args:
+            wait_for_window: Sleep until the next booking window opens before the
+                first attempt instead of polling through hours with nothing new
         """
         preferences = self.config['preferences']
         check_interval = self.config['automation']['check_interval_minutes']
 
-        target_date = (datetime.now() + timedelta(days=preferences['days_ahead'])).strftime('%m/%d/%Y')
-
         logger.info("Charleston Municipal Tee Time Auto-Booker Started")
-        logger.info(f"Target date: {target_date}")
         logger.info(f"Preferred times: {', '.join(preferences['preferred_times'])}")
         logger.info(f"Check interval: {check_interval} minutes")
 
         # Use the first preferred time as the begin time filter
         target_time = preferences['preferred_times'][0]
 
+        # Launch Chromium once; each retry only re-navigates the same page.
+        # When waiting for the window, prewarm() launches it just before release
+        # rather than leaving it idle for hours; set up here if that didn't happen.
         try:
-            await self.book_tee_time(target_date, target_time)
-            logger.info(f"Successfully booked for {target_date}!")
-        except Exception as e:
-            logger.error(f"Booking failed: {str(e)}")
+            if wait_for_window:
+                await self.wait_for_booking_window(prewarm_seconds=PREWARM_SECONDS)
+            if self._browser is None:
+                await self._setup()
+
+            today = target_date = None
+            while True:
+                # days_ahead is relative to today, so only recompute when the day rolls over
+                now_date = datetime.now().date()
+                if now_date != today:
+                    today = now_date
+                    target_date = (today + timedelta(days=preferences['days_ahead'])).strftime('%m/%d/%Y')
+                    logger.info(f"Target date: {target_date}")
+                try:
+                    if await self._attempt(target_date, target_time):
+                        logger.info(f"Successfully booked for {target_date}!")
+                        return
+                except Exception as e:
+                    logger.error(f"Booking failed: {str(e)}")
+                logger.info(f"Retrying in {check_interval} minutes...")
+                await asyncio.sleep(check_interval * 60)
+        finally:
+            await self._teardown()
 
 
 async def main():
     """Main entry point"""
-    booker = TeeTimeBooker()
+    booker = await TeeTimeBooker.create()
 
     if booker.config['automation'].get('use_imessage', False):
         from imessage_booker import prompt_for_booking, send_booking_result, send_imessage
@@ -663,8 +1018,10 @@ async def main():
         # Option 1: Book immediately for specific date/time
         # await booker.book_tee_time('2026-02-14', '08:00')
 
-        # Option 2: Continuously monitor and auto-book
-        await booker.monitor_and_book()
+        # Option 2: Continuously monitor and auto-book (optionally from the next window opening)
+        await booker.monitor_and_book(
+            wait_for_window=booker.config['automation'].get('wait_for_window', False)
+        )
 
 
 if __name__ == "__main__":